@@ -29,6 +29,14 @@ class Settings(BaseModel):
     PLAYWRIGHT_VIEWPORT_WIDTH: int = int(os.getenv("PLAYWRIGHT_VIEWPORT_WIDTH", "1920"))
     PLAYWRIGHT_VIEWPORT_HEIGHT: int = int(os.getenv("PLAYWRIGHT_VIEWPORT_HEIGHT", "1080"))
     
+    # Selenium settings
+    SELENIUM_HEADLESS: bool = os.getenv("SELENIUM_HEADLESS", "True").lower() in ["true", "1", "t"]
+    SELENIUM_TIMEOUT: int = int(os.getenv("SELENIUM_TIMEOUT", "30"))  # seconds
+    SELENIUM_POOL_SIZE: int = int(os.getenv("SELENIUM_POOL_SIZE", "2"))  # concurrent Chrome instances
+    SELENIUM_DEBUGGER_ADDRESS: str = os.getenv("SELENIUM_DEBUGGER_ADDRESS", "")  # host:port of a running Chrome to attach to
+    SELENIUM_SIMULATE_TYPING: bool = os.getenv("SELENIUM_SIMULATE_TYPING", "False").lower() in ["true", "1", "t"]  # type queries instead of deep-linking
+    SELENIUM_DEBUG: bool = os.getenv("SELENIUM_DEBUG", "False").lower() in ["true", "1", "t"]  # save screenshots/HTML to debug/
+    
     # User agent to be used in requests/Playwright
     USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36"
     
@@ -46,6 +54,7 @@ class Settings(BaseModel):
     # Content extraction settings
     MIN_CONTENT_LENGTH: int = int(os.getenv("MIN_CONTENT_LENGTH", "500"))
     MAX_CONTENT_LENGTH: int = int(os.getenv("MAX_CONTENT_LENGTH", "50000"))
+    NLTK_SENTENCE_SPLIT: bool = os.getenv("NLTK_SENTENCE_SPLIT", "False").lower() in ["true", "1", "t"]  # Punkt instead of the faster regex splitter
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -1,10 +1,12 @@
 import logging
 import asyncio
 import re
+import json
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 import requests
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import newspaper
 from newspaper import Article
 import time
@@ -16,6 +18,24 @@ from services.web_searcher import web_searcher
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml parser; fall back to the stdlib one if lxml isn't installed
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    logger.warning("lxml not installed, falling back to html.parser")
+    _HTML_PARSER = "html.parser"
+
+# CSS selectors compiled once instead of on every select()/select_one() call
+_CONTENT_CONTAINER_SELECTORS = tuple(
+    sv.compile(selector)
+    for selector in ['article', 'main', '.content', '#content', '.post', '.article', '.entry']
+)
+_BOILERPLATE_SELECTOR = sv.compile(
+    'nav, header, footer, sidebar, .sidebar, .navigation, .footer, .header, .nav, .menu, '
+    '.comments, .comment, script, style, [role=banner], [role=navigation]'
+)
+
 class ScraperResult(BaseModel):
     url: str
     title: str
@@ -122,7 +142,7 @@ class ContentExtractor:
                     raise Exception("Failed to get page source")
                     
                 # Parse with BeautifulSoup
-                soup = BeautifulSoup(html, 'lxml')
+                soup = BeautifulSoup(html, _HTML_PARSER)
                 if not soup:
                     raise Exception("Failed to parse HTML with BeautifulSoup")
                 
@@ -134,14 +154,14 @@ class ContentExtractor:
                 main_content = None
                 
                 # Look for common content containers
-                for selector in ['article', 'main', '.content', '#content', '.post', '.article', '.entry']:
+                for selector in _CONTENT_CONTAINER_SELECTORS:
                     try:
-                        container = soup.select_one(selector)
+                        container = selector.select_one(soup)
                         if container and len(container.text.strip()) > 500:
                             main_content = container
                             break
                     except (AttributeError, Exception) as e:
-                        logger.warning(f"Error selecting {selector}: {str(e)}")
+                        logger.warning(f"Error selecting {selector.pattern}: {str(e)}")
                         continue
                 
                 # If no container found, use body
@@ -155,7 +175,7 @@ class ContentExtractor:
                 
                 # Remove navigation, sidebars, footers, etc.
                 try:
-                    for tag in main_content.select('nav, header, footer, sidebar, .sidebar, .navigation, .footer, .header, .nav, .menu, .comments, .comment, script, style, [role=banner], [role=navigation]'):
+                    for tag in _BOILERPLATE_SELECTOR.select(main_content):
                         tag.decompose()
                 except (AttributeError, Exception) as e:
                     logger.warning(f"Error removing tags: {str(e)}")
@@ -223,7 +243,7 @@ class ContentExtractor:
             structured_data = {}
             
             # Parse HTML
-            soup = BeautifulSoup(html, 'lxml')
+            soup = BeautifulSoup(html, _HTML_PARSER)
             if not soup:
                 return {}
             
@@ -232,7 +252,6 @@ class ContentExtractor:
                 json_ld_scripts = soup.find_all('script', type='application/ld+json')
                 for script in json_ld_scripts:
                     try:
-                        import json
                         data = json.loads(script.string)
                         if '@type' in data:
                             structured_data[data['@type']] = data
@@ -101,6 +101,17 @@ class InformationSynthesizer:
             # Combine keywords, prioritizing query keywords
             all_keywords = query_keywords + [kw for kw in text_keywords if kw not in query_keywords]
             
+            # Give higher weight to query keywords and earlier keywords, worked out once rather than per sentence
+            # (extract_keywords already returns lowercase terms)
+            weighted_keywords = []
+            for j, keyword in enumerate(all_keywords):
+                weight = 1.0
+                if j < len(query_keywords):
+                    weight = 2.0  # Query keywords are more important
+                elif j < 5:
+                    weight = 1.5  # More important text keywords
+                weighted_keywords.append((keyword, weight))
+            
             # Score sentences based on keyword presence
             sentence_scores = {}
             for i, sentence in enumerate(sentences):
@@ -110,15 +121,8 @@ class InformationSynthesizer:
                 sentence_scores[i] = 0
                 
                 # Score based on keywords
-                for j, keyword in enumerate(all_keywords):
-                    # Give higher weight to query keywords and earlier keywords
-                    weight = 1.0
-                    if j < len(query_keywords):
-                        weight = 2.0  # Query keywords are more important
-                    elif j < 5:
-                        weight = 1.5  # More important text keywords
-                        
-                    if keyword.lower() in sentence_lower:
+                for keyword, weight in weighted_keywords:
+                    if keyword in sentence_lower:
                         sentence_scores[i] += weight
                 
                 # Penalize very short sentences
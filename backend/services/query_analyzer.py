@@ -38,6 +38,12 @@ class QueryAnalyzer:
                 r"opinion", r"thoughts on", r"top \d+"
             ]
         }
+        
+        # One precompiled alternation per query type, so classification is a single scan per type
+        self.compiled_patterns = {
+            query_type: re.compile("|".join(patterns), re.IGNORECASE)
+            for query_type, patterns in self.patterns.items()
+        }
     
     def analyze(self, query: str) -> str:
         """
@@ -72,12 +78,9 @@ class QueryAnalyzer:
         """
         Determine the type of query (factual, exploratory, news, etc.)
         """
-        query_lower = query.lower()
-        
-        for query_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                if re.search(r"(?i)" + pattern, query_lower):
-                    return query_type
+        for query_type, pattern in self.compiled_patterns.items():
+            if pattern.search(query):
+                return query_type
         
         # Default to factual if no pattern matches
         return "factual"
@@ -1,28 +1,365 @@
 import os
-import time
+import glob
+import re
+import random
+import asyncio
+import threading
+import base64
 import logging
-import platform
-import subprocess
-import sys
-from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException, StaleElementReferenceException, JavascriptException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import ChromeType
+from webdriver_manager.core.driver_cache import DriverCacheManager
 import traceback
+import aiohttp
+import orjson
 from shutil import which
 from selenium.webdriver.common.keys import Keys
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
+from urllib.parse import quote_plus, urlsplit, urlunsplit
+from itertools import islice
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 
 from config import settings
  
 logger = logging.getLogger(__name__)
+
+# Anti-automation overrides injected into every new document, kept minified
+_STEALTH_JS = (
+    "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+    "window.navigator.chrome={runtime:{}};"
+    "Object.defineProperty(navigator,'plugins',{get:()=>[1,2,3,4,5]});"
+    "Object.defineProperty(navigator,'languages',{get:()=>['en-US','en','fr']});"
+)
+
+# Any of these means Bing has rendered its result list
+_RESULT_SELECTORS = ("#b_results > li.b_algo", "#b_results h2 a", "#b_content #b_results")
+_RESULTS_READY_JS = f"return !!document.querySelector({', '.join(_RESULT_SELECTORS)!r});"
+
+# Cheap in-page CAPTCHA probe. A page with organic results is never a challenge (the marker words
+# can appear in the query or in result titles), so the start of the body text is only inspected
+# when there are none - we never serialise the whole DOM just to look for a few words
+_CAPTCHA_MARKERS = ("captcha", "unusual traffic", "security check")
+_CAPTCHA_JS = (
+    "if (document.querySelector('#b_results > li.b_algo')) return false;"
+    "const b = document.body ? document.body.innerText.slice(0, 2000).toLowerCase() : '';"
+    f"return {list(_CAPTCHA_MARKERS)!r}.some(m => b.includes(m));"
+)
+
+# Homepage search box; the generic fallbacks cover layout variants in one wait instead of one wait each
+_SEARCH_BOX_SELECTOR = "#sb_form_q, textarea[name='q'], input[name='q']"
+
+# Bing result containers and the snippet candidates inside each one, in priority order
+_RESULT_CONTAINER_SELECTOR = "#b_results > li.b_algo"
+_SNIPPET_SELECTORS = ("p", ".b_caption p", ".b_snippet")
+
+# Collects {title, url, snippet} for every result container in a single round-trip.
+# arguments: [container selector, snippet selectors, limit]
+_EXTRACT_RESULTS_JS = """
+const out = [];
+for (const r of document.querySelectorAll(arguments[0])) {
+    const a = r.querySelector('h2 a');
+    if (!a) continue;
+    const title = a.innerText.trim();
+    let url = a.href;
+    if (!url) {
+        const cite = r.querySelector('cite');
+        const c = cite ? cite.innerText.trim() : '';
+        if (c) url = /^https?:\\/\\//.test(c) ? c : 'https://' + c;
+    }
+    if (!title || !url) continue;
+    let snippet = '';
+    for (const sel of arguments[1]) {
+        const e = r.querySelector(sel);
+        const t = e ? e.innerText.trim() : '';
+        if (t.length > 20) { snippet = t; break; }
+    }
+    out.push({title: title, url: url, snippet: snippet || 'No description available'});
+    if (out.length >= arguments[2]) break;
+}
+return out;
+"""
+
+# Images, fonts, stylesheets and media blocked via CDP - only the DOM is ever read. This is the only
+# image-blocking mechanism: unlike launch prefs/flags it also applies when attaching to a running Chrome
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.css", "*.mp4"
+)
+
+# Scroll to the bottom and return the height scrolled to, using body or falling back to documentElement
+_SCROLL_STEP_JS = (
+    "const b = document.body, d = document.documentElement;"
+    "const r = (b && typeof b.scrollHeight !== 'undefined') ? b"
+    " : (d && typeof d.scrollHeight !== 'undefined') ? d : null;"
+    "if (!r) return null;"
+    "const h = r.scrollHeight; window.scrollTo(0, h); return h;"
+)
+
+# Serialise just the results list for the lxml fallback
+_RESULTS_HTML_JS = "const r = document.getElementById('b_results'); return r ? r.outerHTML : null;"
+
+# The same lookups as compiled XPath, used when parsing the serialised page with lxml
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_CONTAINER_XPATH = XPath(f"//*[@id='b_results']/li[{_has_class('b_algo')}]")
+_TITLE_LINK_XPATH = XPath(".//h2//a")
+_CITE_XPATH = XPath(".//cite")
+# All snippet candidates in one traversal (document order)
+_SNIPPET_XPATH = XPath(f".//p | .//*[{_has_class('b_caption')}]//p | .//*[{_has_class('b_snippet')}]")
+
+def _text(element):
+    """Concatenated, stripped text content of an lxml element"""
+    return "".join(element.itertext()).strip()
+
+# Anchors, scripts and links that point back into Bing itself rather than to a result page
+_SKIP_HREF_RE = re.compile(
+    r"^(?:#|javascript:|https?://(?:www\.)?(?:bing\.com/(?:search|images|videos)|go\.microsoft\.com))",
+    re.IGNORECASE
+)
+
+# Query parameters that only carry click tracking and never change the page
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid=", "gclid=", "msclkid=")
+
+def _canon(url):
+    """Normalize a URL into a dedupe key (lowercase host, no fragment or tracking params)"""
+    parts = urlsplit(url)
+    query = "&".join(p for p in parts.query.split("&") if p and not p.startswith(_TRACKING_PARAM_PREFIXES))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip("/") or "/", query, ""))
+
+# Searx instances queried by the API-based fallback
+_SEARX_INSTANCES = (
+    "https://searx.be/search",
+    "https://search.disroot.org/search",
+    "https://search.mdosch.de/search"
+)
+
+_SEARX_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9"
+}
+
+# Pre-accepted consent cookie so Bing never renders its cookie banner
+_CONSENT_COOKIES = (
+    {"name": "BCP", "value": "AD=1&AL=1&SM=1", "domain": ".bing.com", "path": "/", "secure": True},
+)
+
+# Origins whose cookies a state reset clears
+_BING_COOKIE_URLS = ["https://www.bing.com", "https://bing.com"]
+
+# Bing results fetched without a browser carry the consent cookie in the request itself
+_BING_SEARCH_URL = "https://www.bing.com/search"
+_BING_HTTP_HEADERS = {
+    "Cookie": "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in _CONSENT_COOKIES)
+}
+
+# Source of the "heavy traffic" stand-in result, which must never be cached
+_PLACEHOLDER_SOURCE = "API-based search"
+
+def _pack_result(title, url, snippet, position, source):
+    """Build the result dict returned by every search path"""
+    return {
+        "title": title,
+        "url": url,
+        "snippet": snippet,
+        "position": position,
+        "source": source  # Mark the source
+    }
+
+def _iter_js_results(rows, processed_urls):
+    """Yield (title, url, snippet) for each usable row returned by _EXTRACT_RESULTS_JS"""
+    for row in rows:
+        title = (row.get("title") or "").strip()
+        url = row.get("url") or ""
+        snippet = row.get("snippet") or "No description available"
+        
+        if _SKIP_HREF_RE.match(url):
+            continue
+        key = _canon(url)
+        if key in processed_urls:
+            continue
+        processed_urls.add(key)
+        
+        # Validate that we have all required fields before yielding the result
+        if title and url and snippet:
+            yield title, url, snippet
+        else:
+            logger.warning(f"Skipping incomplete Bing result: title={bool(title)}, url={bool(url)}, snippet={bool(snippet)}")
+
+def _extract_lxml_result(result, processed_urls):
+    """Return (title, url, snippet) for one Bing result container, or None if it is unusable"""
+    try:
+        # Extract title and URL
+        title_elems = _TITLE_LINK_XPATH(result)
+        if not title_elems:
+            return None
+        
+        title_elem = title_elems[0]
+        title = _text(title_elem)
+        url = title_elem.get('href', '')
+        
+        # Ensure URL is not None or empty
+        if not url:
+            # Try getting the URL from the cite element
+            cite_elems = _CITE_XPATH(result)
+            if cite_elems:
+                cite_url = _text(cite_elems[0])
+                if cite_url and cite_url.startswith(('http://', 'https://')):
+                    url = cite_url
+                elif cite_url and not cite_url.startswith(('http://', 'https://')):
+                    url = "https://" + cite_url
+        
+        # Skip if URL is still None or empty, internal, or already extracted
+        if not url or _SKIP_HREF_RE.match(url):
+            return None
+        key = _canon(url)
+        if key in processed_urls:
+            return None
+        processed_urls.add(key)
+        
+        # Extract snippet - first candidate long enough to be a real description
+        snippet = next(
+            (text for text in map(_text, _SNIPPET_XPATH(result)) if len(text) > 20),
+            "No description available"
+        )
+    except Exception as e:
+        logger.debug(f"Error extracting Bing result with lxml: {str(e)}")
+        return None
+    
+    # Validate that we have all required fields
+    if title and url and snippet:
+        return title, url, snippet
+    return None
+
+def _iter_lxml_results(tree, processed_urls):
+    """Yield (title, url, snippet) for each Bing result container in a parsed page"""
+    for result in _CONTAINER_XPATH(tree):
+        extracted = _extract_lxml_result(result, processed_urls)
+        if extracted:
+            yield extracted
+
+def _iter_searx_results(items):
+    """Yield (title, url, snippet) for each complete item in a Searx JSON result list"""
+    for item in items:
+        try:
+            title = item.get("title", "").strip()
+            url = item.get("url", "")
+            snippet = item.get("content", item.get("snippet", "No description available")).strip()
+        except Exception:
+            continue
+        
+        # Validate that we have all required fields
+        if title and url and snippet:
+            yield title, url, snippet
  
+# Resolved once per process; every later SeleniumBrowser reuses it
+_CHROMEDRIVER_PATH = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+# Where webdriver_manager keeps downloaded drivers (mount it as a volume to survive container restarts)
+_WDM_ROOT = os.environ.get("WDM_CACHE_DIR") or os.path.expanduser("~")
+
+def _locate_chromedriver():
+    """Find a ChromeDriver binary, preferring anything on disk over webdriver_manager's network check"""
+    # First priority: Use the ChromeDriver specified in environment variables
+    chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', None)
+    logger.info(f"ChromeDriver path from env: {chromedriver_path}")
+    if chromedriver_path and os.path.exists(chromedriver_path):
+        logger.info(f"Using system ChromeDriver at: {chromedriver_path}")
+        return chromedriver_path
+    
+    # Second priority: Search for ChromeDriver in PATH
+    path_chromedriver = which('chromedriver')
+    if path_chromedriver:
+        logger.info(f"Found ChromeDriver in PATH: {path_chromedriver}")
+        return path_chromedriver
+    
+    # Third priority: A driver webdriver_manager already downloaded, newest first
+    # (it may predate a Chrome upgrade; start() swaps it for a matching one if Chrome rejects it)
+    cached = [
+        path for path in glob.glob(os.path.join(_WDM_ROOT, ".wdm", "drivers", "chromedriver", "**", "chromedriver*"), recursive=True)
+        if os.path.isfile(path) and os.access(path, os.X_OK)
+    ]
+    if cached:
+        cached_path = max(cached, key=os.path.getmtime)
+        logger.info(f"Using cached ChromeDriver at: {cached_path}")
+        return cached_path
+    
+    # Last resort: Use webdriver_manager to download ChromeDriver
+    logger.info("No system ChromeDriver found, using webdriver_manager")
+    return _download_chromedriver()
+
+def _download_chromedriver():
+    """Install the ChromeDriver matching the installed Chrome through webdriver_manager"""
+    try:
+        # Treat a cached driver as valid for 30 days so restarts skip the version-check request
+        cache_manager = DriverCacheManager(root_dir=_WDM_ROOT, valid_range=30)
+        driver_path = ChromeDriverManager(cache_manager=cache_manager).install()
+        logger.info(f"Downloaded ChromeDriver to: {driver_path}")
+        return driver_path
+    except Exception as e:
+        logger.error(f"Failed to download ChromeDriver: {str(e)}")
+        raise Exception("Could not find or install ChromeDriver")
+
+def _is_cached_chromedriver(path):
+    """Whether path is a driver from webdriver_manager's cache rather than one the user configured"""
+    return os.path.abspath(path).startswith(os.path.join(os.path.abspath(_WDM_ROOT), ".wdm") + os.sep)
+
+def _replace_stale_chromedriver(stale_path):
+    """Swap a cached driver Chrome refused for one matching the installed Chrome, once per process"""
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        # Another browser may have replaced it already
+        if _CHROMEDRIVER_PATH in (None, stale_path):
+            _CHROMEDRIVER_PATH = _download_chromedriver()
+        return _CHROMEDRIVER_PATH
+
+def _resolve_chromedriver():
+    """Return the process-wide ChromeDriver path, locating it on first use"""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH:
+        return _CHROMEDRIVER_PATH
+    
+    # Pooled browsers start on their own executor threads; only one of them may search or download
+    with _CHROMEDRIVER_LOCK:
+        if not _CHROMEDRIVER_PATH:
+            _CHROMEDRIVER_PATH = _locate_chromedriver()
+        return _CHROMEDRIVER_PATH
+
+async def _search_bing_http(session, query):
+    """Fetch Bing's results page over plain HTTP and parse it with lxml, without a browser"""
+    results = []
+    
+    try:
+        params = {"q": query, "setlang": "en", "count": str(settings.SEARCH_RESULTS_LIMIT)}
+        async with session.get(_BING_SEARCH_URL, params=params, headers=_BING_HTTP_HEADERS, timeout=10) as response:
+            if response.status != 200:
+                logger.warning(f"Bing HTTP search returned status {response.status}")
+                return results
+            page_html = await response.text()
+        
+        # Bing's result links are relative (/ck/a?...), so resolve them against the search URL
+        tree = lxml_html.fromstring(page_html, base_url=_BING_SEARCH_URL)
+        tree.make_links_absolute()
+        items = _iter_lxml_results(tree, set())
+        for position, (title, url, snippet) in enumerate(islice(items, settings.SEARCH_RESULTS_LIMIT), 1):
+            results.append(_pack_result(title, url, snippet, position, "Bing (HTTP)"))
+    except Exception as e:
+        logger.warning(f"Bing HTTP search failed: {str(e)}")
+    
+    logger.info(f"Bing HTTP search found {len(results)} results")
+    return results
+
 class SeleniumBrowser:
     """
     A utility class for Selenium browser automation
@@ -36,7 +373,60 @@ class SeleniumBrowser:
          self.driver = None
          self.max_retry_count = 1
          self.debug_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "debug")
+         self.http_session = None
+         # WebDriver is not thread-safe, so every driver call for this browser runs on one dedicated thread
+         self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium")
 
+    def _build_launch_options(self):
+        """Build the Chrome options used when launching a fresh browser"""
+        # Set up Chrome options with anti-detection measures
+        chrome_options = Options()
+        
+        # Set up Chrome options for headless mode with improved stealth
+        if self.headless:
+            # Use Selenium's new headless mode
+            chrome_options.add_argument("--headless=new")
+            
+            # Add window size that looks like a normal desktop
+            chrome_options.add_argument("--window-size=1920,1080")
+            
+            # Disable automation flags
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            chrome_options.add_experimental_option("useAutomationExtension", False)
+            
+            # Hide WebDriver usage with CDP
+            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        
+        # Add additional options for performance and compatibility
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        
+        # Add more humanlike settings
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--lang=en-US,en;q=0.9")
+        chrome_options.add_argument("--start-maximized")
+        chrome_options.add_argument("--disable-popup-blocking")
+        
+        # Keep each driver's footprint small so more of them fit in the pool
+        chrome_options.add_argument("--renderer-process-limit=1")
+        chrome_options.add_argument("--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints")
+        chrome_options.add_argument("--js-flags=--max-old-space-size=256")
+        
+        # Use a more realistic user agent to reduce detection
+        user_agents = [
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36 Edg/126.0.0.0",
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+        ]
+        user_agent = random.choice(user_agents)
+        logger.info(f"Using user agent: {user_agent}")
+        chrome_options.add_argument(f"--user-agent={user_agent}")
+        
+        return chrome_options
+    
     async def start(self):
         """Start the Selenium browser"""
         if self.driver:
@@ -44,54 +434,18 @@ class SeleniumBrowser:
             return True
             
         try:
-            # Log the system architecture
-            system_arch = platform.architecture()[0]
-            logger.info(f"System architecture: {system_arch}")
-            
-            # Set up Chrome options with anti-detection measures
-            chrome_options = Options()
-            
-            # Set up Chrome options for headless mode with improved stealth
-            if self.headless:
-                # Use Selenium's new headless mode
-                chrome_options.add_argument("--headless=new")
-                
-                # Add window size that looks like a normal desktop
-                chrome_options.add_argument("--window-size=1920,1080")
-                
-                # Disable automation flags
-                chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                chrome_options.add_experimental_option("useAutomationExtension", False)
-                
-                # Hide WebDriver usage with CDP
-                chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            
-            # Add additional options for performance and compatibility
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--disable-extensions")
-            
-            # Add more humanlike settings
-            chrome_options.add_argument("--disable-notifications")
-            chrome_options.add_argument("--lang=en-US,en;q=0.9")
-            chrome_options.add_argument("--start-maximized")
-            chrome_options.add_argument("--disable-popup-blocking")
-            
-            # Use a more realistic user agent to reduce detection
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36 Edg/126.0.0.0",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
-            ]
-            import random
-            user_agent = random.choice(user_agents)
-            logger.info(f"Using user agent: {user_agent}")
-            chrome_options.add_argument(f"--user-agent={user_agent}")
+            if settings.SELENIUM_DEBUGGER_ADDRESS:
+                # Attach to an already-running Chrome (started with --remote-debugging-port)
+                # instead of launching a new browser process for this instance
+                logger.info(f"Attaching to Chrome at: {settings.SELENIUM_DEBUGGER_ADDRESS}")
+                chrome_options = Options()
+                chrome_options.add_experimental_option("debuggerAddress", settings.SELENIUM_DEBUGGER_ADDRESS)
+            else:
+                chrome_options = self._build_launch_options()
             
             # Create debug directory if it doesn't exist
-            os.makedirs(self.debug_dir, exist_ok=True)
+            if settings.SELENIUM_DEBUG:
+                os.makedirs(self.debug_dir, exist_ok=True)
             
             # Check if we're running in Docker
             is_docker = os.environ.get('DOCKER_CONTAINER', False) or os.path.exists('/.dockerenv')
@@ -99,33 +453,9 @@ class SeleniumBrowser:
             
             # Check for environment variables 
             chrome_path = os.environ.get('CHROME_BIN', None)
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH', None)
-            
             logger.info(f"Chrome path from env: {chrome_path}")
-            logger.info(f"ChromeDriver path from env: {chromedriver_path}")
             
-            webdriver_service = None
-            
-            # First priority: Use the ChromeDriver specified in environment variables
-            if chromedriver_path and os.path.exists(chromedriver_path):
-                logger.info(f"Using system ChromeDriver at: {chromedriver_path}")
-                webdriver_service = Service(executable_path=chromedriver_path)
-            else:
-                # Second priority: Search for ChromeDriver in PATH
-                path_chromedriver = which('chromedriver')
-                if path_chromedriver:
-                    logger.info(f"Found ChromeDriver in PATH: {path_chromedriver}")
-                    webdriver_service = Service(executable_path=path_chromedriver)
-                else:
-                    # Last resort: Use webdriver_manager to download ChromeDriver
-                    logger.info("No system ChromeDriver found, using webdriver_manager")
-                    try:
-                        driver_path = ChromeDriverManager().install()
-                        logger.info(f"Downloaded ChromeDriver to: {driver_path}")
-                        webdriver_service = Service(driver_path)
-                    except Exception as e:
-                        logger.error(f"Failed to download ChromeDriver: {str(e)}")
-                        raise Exception("Could not find or install ChromeDriver")
+            driver_path = await self._run(_resolve_chromedriver)
             
             # Set Chrome binary location if specified in environment
             if chrome_path and os.path.exists(chrome_path):
@@ -134,31 +464,18 @@ class SeleniumBrowser:
             
             # Start the browser
             logger.info("Launching Chrome browser...")
-            self.driver = webdriver.Chrome(service=webdriver_service, options=chrome_options)
-            
-            # Set page load timeout
-            self.driver.set_page_load_timeout(settings.SELENIUM_TIMEOUT)
-            
-            # Execute JavaScript to hide automation
-            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": """
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                    window.navigator.chrome = {
-                        runtime: {}
-                    };
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['en-US', 'en', 'fr']
-                    });
-                """
-            })
+            try:
+                await self._run(self._launch, Service(executable_path=driver_path), chrome_options)
+            except SessionNotCreatedException as e:
+                if not _is_cached_chromedriver(driver_path):
+                    raise
+                # A cached driver stops matching after a Chrome upgrade; fetch the right one and retry once
+                logger.warning(f"Cached ChromeDriver rejected by Chrome, downloading a matching one: {str(e)}")
+                driver_path = await self._run(_replace_stale_chromedriver, driver_path)
+                await self._run(self._launch, Service(executable_path=driver_path), chrome_options)
             
             # Take screenshot to confirm browser started
-            self.driver.save_screenshot(os.path.join(self.debug_dir, "browser_started.png"))
+            await self._save_screenshot("browser_started")
             
             logger.info("Browser started successfully")
             return True
@@ -168,76 +485,94 @@ class SeleniumBrowser:
             logger.error(traceback.format_exc())
             return False
     
-    #not used anywhere
-    def _get_chrome_version(self):
-         """Get Chrome version if possible"""
-         try:
-             if sys.platform.startswith('win'):
-                 # Windows
-                 chrome_paths = [
-                     os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                     os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                     os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
-                 ]
-                 
-                 for path in chrome_paths:
-                     if os.path.exists(path):
-                         try:
-                             result = subprocess.run([path, '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                             if result.stdout:
-                                 return result.stdout.strip()
-                         except Exception:
-                             pass
-             return None
-         except Exception as e:
-             logger.warning(f"Unable to get Chrome version: {str(e)}")
-             return None
-
-    #not used anywhere
-    def _clear_driver_cache(self):
-         """Clear ChromeDriver cache"""
-         try:
-             # Clear old driver cache if it exists
-             cache_path = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
-             if os.path.exists(cache_path):
-                 logger.info(f"Clearing old ChromeDriver cache at {cache_path}")
-                 import shutil
-                 try:
-                     shutil.rmtree(cache_path)
-                 except Exception as e:
-                     logger.warning(f"Failed to clear cache: {str(e)}")
-         except Exception as e:
-             logger.warning(f"Error during cache clearing: {str(e)}")
-
-    #not used anywhere
-    def _find_chrome_path(self):
-         """Find Chrome installation path"""
-         try:
-             # Common Chrome paths on Windows
-             chrome_paths = [
-                 os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                 os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                 os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
-             ]
+    def _launch(self, webdriver_service, chrome_options):
+         """Create and prepare the driver (runs on the browser's executor thread)"""
+         self.driver = webdriver.Chrome(service=webdriver_service, options=chrome_options)
+         
+         # Set page load timeout
+         self.driver.set_page_load_timeout(settings.SELENIUM_TIMEOUT)
+         
+         # Execute JavaScript to hide automation
+         self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
+         
+         # Skip subresources the extractors never read
+         self.driver.execute_cdp_cmd("Network.enable", {})
+         self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
+         
+         # Pre-seed consent so the cookie banner never appears on result pages
+         self._seed_consent_cookies()
+    
+    async def _run(self, func, *args):
+         """Run a blocking driver call on this browser's executor thread"""
+         return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+    
+    def _seed_consent_cookies(self):
+         """Set the consent cookies directly via CDP"""
+         for cookie in _CONSENT_COOKIES:
+             try:
+                 self.driver.execute_cdp_cmd("Network.setCookie", cookie)
+             except Exception as e:
+                 logger.warning(f"Failed to set {cookie['name']} cookie: {str(e)}")
+    
+    def _clear_state(self):
+         """Clear Bing's cookies and site storage via CDP, then restore the consent cookie"""
+         # Only bing.com cookies: an attached Chrome may hold the user's own sessions for other sites
+         cookies = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": _BING_COOKIE_URLS})["cookies"]
+         for cookie in cookies:
+             self.driver.execute_cdp_cmd("Network.deleteCookies", {
+                 "name": cookie["name"],
+                 "domain": cookie["domain"],
+                 "path": cookie["path"]
+             })
+         self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+             "origin": "https://www.bing.com",
+             "storageTypes": "all"
+         })
+         self._seed_consent_cookies()
+    
+    async def reset_state(self):
+         """
+         Reset per-search browser state without navigating away
+         """
+         if not self.driver:
+             return
              
-             for path in chrome_paths:
-                 if os.path.exists(path):
-                     return path
-             return None
+         try:
+             await self._run(self._clear_state)
          except Exception as e:
-             logger.warning(f"Error finding Chrome path: {str(e)}")
-             return None
-    #not used anywhere
+             logger.warning(f"Error resetting browser state: {str(e)}")
+    
     async def stop(self):
          """
          Stop the browser
          """
          if self.driver:
              try:
-                 self.driver.quit()
+                 await self._run(self.driver.quit)
                  logger.info("Selenium browser stopped")
              except Exception as e:
                  logger.error(f"Error stopping Selenium browser: {str(e)}")
+             finally:
+                 # Let navigate() see the browser as stopped so it starts a fresh one if used again
+                 self.driver = None
+         
+         # Release the driver thread; a fresh executor is only spun up if this browser is started again
+         self.executor.shutdown(wait=False)
+         self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium")
+         
+         if self.http_session and not self.http_session.closed:
+             await self.http_session.close()
+    
+    def _get_http_session(self):
+         """
+         Get the shared HTTP session, creating it on first use so connections are kept alive across searches
+         """
+         if self.http_session is None or self.http_session.closed:
+             self.http_session = aiohttp.ClientSession(
+                 headers=_SEARX_HEADERS,
+                 connector=aiohttp.TCPConnector(limit=8)
+             )
+         return self.http_session
      
     async def navigate(self, url):
          """
@@ -248,12 +583,31 @@ class SeleniumBrowser:
              
          try:
              logger.info(f"Navigating to: {url}")
-             self.driver.get(url)
+             await self._run(self.driver.get, url)
              return True
+         except TimeoutException as e:
+             logger.error(f"Navigation timed out: {str(e)}")
+             return False
+         except WebDriverException as e:
+             # Chrome or its session is gone; drop it so the next navigate() starts a fresh one
+             logger.error(f"Navigation error, restarting browser on next use: {str(e)}")
+             await self._discard_driver()
+             return False
          except Exception as e:
              logger.error(f"Navigation error: {str(e)}")
              return False
      
+    async def _discard_driver(self):
+         """
+         Quit and forget the current driver (best effort) without touching the shared HTTP session
+         """
+         driver, self.driver = self.driver, None
+         if driver:
+             try:
+                 await self._run(driver.quit)
+             except Exception as e:
+                 logger.debug(f"Error quitting dead driver: {str(e)}")
+     
     async def get_page_source(self):
          """
          Get the page source
@@ -262,11 +616,57 @@ class SeleniumBrowser:
              return ""
              
          try:
-             return self.driver.page_source
+             return await self._run(lambda: self.driver.page_source)
          except Exception as e:
              logger.error(f"Error getting page source: {str(e)}")
              return ""
      
+    def _extract_results_via_js(self, limit):
+         """
+         Extract Bing results inside the page and return them as a list of dicts
+         """
+         try:
+             return self.driver.execute_script(
+                 _EXTRACT_RESULTS_JS, _RESULT_CONTAINER_SELECTOR, list(_SNIPPET_SELECTORS), limit
+             ) or []
+         except JavascriptException as e:
+             logger.debug(f"Error extracting Bing results via JS: {str(e)}")
+             return []
+     
+    async def _save_screenshot(self, name):
+         """
+         Save a low-quality JPEG screenshot to the debug directory (debug mode only)
+         """
+         if not settings.SELENIUM_DEBUG:
+             return
+         
+         try:
+             # Page.captureScreenshot as JPEG is far cheaper to encode than save_screenshot's PNG
+             data = await self._run(
+                 self.driver.execute_cdp_cmd,
+                 "Page.captureScreenshot",
+                 {"format": "jpeg", "quality": 30, "captureBeyondViewport": False}
+             )
+             await asyncio.to_thread(
+                 self._write_debug, os.path.join(self.debug_dir, f"{name}.jpg"), base64.b64decode(data["data"])
+             )
+         except Exception as e:
+             logger.warning(f"Failed to capture screenshot {name}: {str(e)}")
+     
+    def _write_debug(self, path, data):
+         """
+         Write a debug artifact to disk (run off the event loop)
+         """
+         try:
+             if isinstance(data, bytes):
+                 with open(path, "wb") as f:
+                     f.write(data)
+             else:
+                 with open(path, "w", encoding="utf-8") as f:
+                     f.write(data)
+         except Exception as e:
+             logger.warning(f"Failed to write debug file {path}: {str(e)}")
+     
     async def get_current_url(self):
          """
          Get the current URL
@@ -275,7 +675,7 @@ class SeleniumBrowser:
              return ""
              
          try:
-             return self.driver.current_url
+             return await self._run(lambda: self.driver.current_url)
          except Exception as e:
              logger.error(f"Error getting current URL: {str(e)}")
              return ""
@@ -287,22 +687,58 @@ class SeleniumBrowser:
         if not query:
             return []
             
-        # Search with Bing directly
-        results = await self._search_bing(query)
+        # Plain HTTP first; it usually answers in a few hundred ms, so Chrome and the Searx instances
+        # aren't touched at all unless it comes back empty
+        results = await _search_bing_http(self._get_http_session(), query)
+        if results:
+            return results[:settings.SEARCH_RESULTS_LIMIT]
         
-        # If Bing failed, try alternative search engines
-        if not results:
-            logger.warning("Bing search failed, trying API-based alternatives")
-            results = await self._search_api_based(query)
+        return await self.search_with_browser(query)
+    
+    async def search_with_browser(self, query):
+        """
+        Search Bing in Chrome, falling back to the API-based alternatives if it finds nothing
+        """
+        # Chrome only when Bing wants JS or serves a challenge; start the API-based fallback
+        # alongside it so its latency is hidden behind the browser search
+        fallback_task = asyncio.create_task(self._search_api_based(query))
+        try:
+            results = await self._search_bing(query)
+        except Exception as e:
+            logger.error(f"Bing search raised: {str(e)}")
+            results = []
+        
+        if results:
+            fallback_task.cancel()
+        else:
+            # If Bing failed, use the alternative search that is already in flight
+            logger.warning("Bing search failed, using API-based alternatives")
+            results = await fallback_task
             
         return results[:settings.SEARCH_RESULTS_LIMIT]
         
-    async def _search_google_directly(self, query):
-        """
-        Legacy method kept for compatibility, redirects to Bing search
-        """
-        logger.warning("Google search is no longer used due to CAPTCHA issues, redirecting to Bing")
-        return await self._search_bing(query)
+    async def _submit_query_by_typing(self, query):
+        """Type the query into Bing's homepage search box and submit it"""
+        if not await self.navigate("https://www.bing.com/"):
+            return False
+        
+        try:
+            search_box = await self._run(
+                WebDriverWait(self.driver, 5).until,
+                EC.presence_of_element_located((By.CSS_SELECTOR, _SEARCH_BOX_SELECTOR))
+            )
+            await self._run(search_box.clear)
+            
+            # One send_keys for the whole query plus Enter - per-character typing cost a round-trip and a sleep per char
+            await self._run(search_box.send_keys, query + Keys.RETURN)
+            return True
+        except TimeoutException as e:
+            logger.error(f"Bing search box not found: {str(e)}")
+            return False
+        except WebDriverException as e:
+            logger.error(f"Error with Bing search input, restarting browser on next use: {str(e)}")
+            await self._discard_driver()
+            return False
     
     async def _search_bing(self, query):
         """Search using Bing search engine"""
@@ -311,272 +747,146 @@ class SeleniumBrowser:
         max_retries = 2
         
         while retry_count < max_retries:
+            if retry_count:
+                # Short exponential backoff with jitter between attempts instead of a fixed stall
+                await asyncio.sleep(0.25 * (2 ** retry_count) + random.random() * 0.1)
+            retry_count += 1
+            
             try:
                 logger.info(f"Directly searching Bing for: {query}")
-                success = await self.navigate("https://www.bing.com/")
-                if success:
-                    # Take screenshot
-                    self.driver.save_screenshot(os.path.join(self.debug_dir, "bing_homepage.png"))
+                if settings.SELENIUM_SIMULATE_TYPING:
+                    # Slow human-like path, only for deployments that get challenged on deep links
+                    success = await self._submit_query_by_typing(query)
+                else:
+                    # Deep-link to the results page instead of typing into the homepage search box;
+                    # count= asks Bing for only as many results as we will keep
+                    success = await self.navigate(
+                        f"https://www.bing.com/search?q={quote_plus(query)}&setlang=en&count={settings.SEARCH_RESULTS_LIMIT}"
+                    )
+                if not success:
+                    # navigate() already dropped a dead driver, so the next attempt starts a fresh one
+                    continue
+                
+                logger.info("Submitted Bing search query")
+                
+                # Wait for results - one in-page querySelector covers every candidate selector,
+                # polled every 100ms rather than WebDriverWait's default 500ms
+                try:
+                    await self._run(
+                        WebDriverWait(self.driver, 8, poll_frequency=0.1).until,
+                        lambda d: d.execute_script(_RESULTS_READY_JS)
+                    )
+                except TimeoutException:
+                    logger.warning("Timed out waiting for Bing results to render")
+                
+                # Retrying a challenge page won't help, leave it to the fallback search
+                if await self._run(self.driver.execute_script, _CAPTCHA_JS):
+                    logger.warning("Bing returned a CAPTCHA page")
+                    break
+                
+                # Serialised DOM, fetched at most once per attempt
+                page_html = None
+                
+                if settings.SELENIUM_DEBUG:
+                    await self._save_screenshot("bing_results")
+                    
+                    # Save page source for debugging
+                    page_html = await self.get_page_source()
+                    await asyncio.to_thread(
+                        self._write_debug,
+                        os.path.join(self.debug_dir, "bing_results.html"),
+                        page_html
+                    )
+                
+                # First try direct extraction - one in-page script instead of per-element round-trips
+                rows = await self._run(self._extract_results_via_js, settings.SEARCH_RESULTS_LIMIT)
+                logger.info(f"Found {len(rows)} Bing results")
+                
+                limit = settings.SEARCH_RESULTS_LIMIT
+                # Skip building the per-result log strings when INFO is off
+                log_results = logger.isEnabledFor(logging.INFO)
+                position = 0
+                processed_urls = set()
+                append = results.append
+                for title, url, snippet in islice(_iter_js_results(rows, processed_urls), limit):
+                    position += 1
+                    if log_results:
+                        logger.info(f"Extracted Bing result {position}: '{title[:30]}...' -> {url[:50]}...")
+                    append(_pack_result(title, url, snippet, position, "Bing"))
+                
+                # If we didn't get enough results with direct extraction, parse the page with lxml
+                # (never when the limit is already met - that would serialise and parse the page for nothing)
+                if len(results) < min(3, limit):
+                    logger.info("Trying lxml extraction for Bing results")
+                    if page_html is None:
+                        # Only the results list is serialised and parsed, not the whole SERP
+                        page_html = await self._run(self.driver.execute_script, _RESULTS_HTML_JS)
                     
-                    # Find the search box
                     try:
-                        search_box = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.ID, "sb_form_q"))
-                        )
-                        search_box.clear()
-                        
-                        # Type query with random delays
-                        import random
-                        for char in query:
-                            search_box.send_keys(char)
-                            time.sleep(random.uniform(0.03, 0.12))
-                            
-                        # Submit search
-                        search_box.send_keys(Keys.RETURN)
-                        logger.info("Submitted Bing search query")
-                        
-                        # Wait for results
-                        time.sleep(3)
-                        self.driver.save_screenshot(os.path.join(self.debug_dir, "bing_results.png"))
-                        
-                        # Save page source for debugging
-                        with open(os.path.join(self.debug_dir, "bing_results.html"), "w", encoding="utf-8") as f:
-                            f.write(self.driver.page_source)
-                        
-                        # First try direct extraction
-                        links = self.driver.find_elements(By.CSS_SELECTOR, "#b_results > li.b_algo")
-                        logger.info(f"Found {len(links)} Bing results")
-                        
-                        position = 0
-                        for result in links:
-                            try:
-                                # Extract title
-                                title_elem = result.find_element(By.CSS_SELECTOR, "h2 a")
-                                title = title_elem.text.strip()
-                                
-                                # Extract URL - first from the main link
-                                url = title_elem.get_attribute("href")
-                                
-                                # Ensure URL is not None
-                                if not url:
-                                    # Try getting the URL from the cite element
-                                    try:
-                                        cite_elem = result.find_element(By.CSS_SELECTOR, "cite")
-                                        cite_url = cite_elem.text.strip()
-                                        if cite_url and cite_url.startswith(('http://', 'https://')):
-                                            url = cite_url
-                                        else:
-                                            # Construct a URL if possible
-                                            if cite_url and not cite_url.startswith(('http://', 'https://')):
-                                                url = "https://" + cite_url
-                                    except:
-                                        # Skip this result if we can't get a valid URL
-                                        logger.warning(f"Skipping Bing result with no URL: {title[:30]}...")
-                                        continue
-                                
-                                # Skip if URL is still None or empty
-                                if not url:
-                                    logger.warning(f"Skipping Bing result with no URL: {title[:30]}...")
-                                    continue
-                                
-                                # Extract snippet
-                                snippet = "No description available"
-                                try:
-                                    # Try different potential selectors for snippets
-                                    for snippet_selector in ["p", ".b_caption p", ".b_snippet"]:
-                                        try:
-                                            snippet_elem = result.find_element(By.CSS_SELECTOR, snippet_selector)
-                                            potential_snippet = snippet_elem.text.strip()
-                                            if potential_snippet and len(potential_snippet) > 20:
-                                                snippet = potential_snippet
-                                                break
-                                        except:
-                                            continue
-                                except:
-                                    # Keep default snippet if extraction fails
-                                    pass
-                                
-                                # Validate that we have all required fields before adding the result
-                                if title and url and snippet:
-                                    position += 1
-                                    logger.info(f"Extracted Bing result {position}: '{title[:30]}...' -> {url[:50]}...")
-                                    
-                                    results.append({
-                                        "title": title,
-                                        "url": url,
-                                        "snippet": snippet,
-                                        "position": position,
-                                        "source": "Bing"  # Mark the source
-                                    })
-                                    
-                                    if position >= settings.SEARCH_RESULTS_LIMIT:
-                                        break
-                                else:
-                                    logger.warning(f"Skipping incomplete Bing result: title={bool(title)}, url={bool(url)}, snippet={bool(snippet)}")
-                            except Exception as e:
-                                logger.debug(f"Error extracting Bing result: {str(e)}")
-                                continue
-                        
-                        # If we didn't get enough results with direct extraction, try BeautifulSoup
-                        if len(results) < 3:
-                            logger.info("Trying BeautifulSoup extraction for Bing results")
-                            try:
-                                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                                result_elements = soup.select("#b_results > li.b_algo")
-                                
-                                for result in result_elements:
-                                    try:
-                                        # Extract title and URL
-                                        title_elem = result.select_one("h2 a")
-                                        if not title_elem:
-                                            continue
-                                            
-                                        title = title_elem.get_text().strip()
-                                        url = title_elem.get('href', '')
-                                        
-                                        # Ensure URL is not None or empty
-                                        if not url:
-                                            # Try getting the URL from the cite element
-                                            cite_elem = result.select_one("cite")
-                                            if cite_elem:
-                                                cite_url = cite_elem.get_text().strip()
-                                                if cite_url and cite_url.startswith(('http://', 'https://')):
-                                                    url = cite_url
-                                                elif cite_url and not cite_url.startswith(('http://', 'https://')):
-                                                    url = "https://" + cite_url
-                                        
-                                        # Skip if URL is still None or empty
-                                        if not url:
-                                            continue
-                                        
-                                        # Extract snippet
-                                        snippet = "No description available"
-                                        snippet_elem = result.select_one("p") or result.select_one(".b_caption p") or result.select_one(".b_snippet")
-                                        if snippet_elem:
-                                            snippet = snippet_elem.get_text().strip()
-                                        
-                                        # Validate that we have all required fields before adding the result
-                                        if title and url and snippet:
-                                            position += 1
-                                            logger.info(f"Extracted Bing result {position} (BS): '{title[:30]}...' -> {url[:50]}...")
-                                            
-                                            results.append({
-                                                "title": title,
-                                                "url": url,
-                                                "snippet": snippet,
-                                                "position": position,
-                                                "source": "Bing (BS)"  # Mark the source
-                                            })
-                                            
-                                            if position >= settings.SEARCH_RESULTS_LIMIT:
-                                                break
-                                    except Exception as e:
-                                        logger.debug(f"Error extracting Bing result with BeautifulSoup: {str(e)}")
-                                        continue
-                            except Exception as bs_error:
-                                logger.error(f"Error during BeautifulSoup extraction for Bing: {str(bs_error)}")
-                    except Exception as e:
-                        logger.error(f"Error with Bing search input: {str(e)}")
+                        tree = lxml_html.fromstring(page_html, base_url=_BING_SEARCH_URL) if page_html else None
+                        if tree is not None:
+                            tree.make_links_absolute()
+                            remaining = limit - len(results)
+                            for title, url, snippet in islice(_iter_lxml_results(tree, processed_urls), remaining):
+                                position += 1
+                                if log_results:
+                                    logger.info(f"Extracted Bing result {position} (lxml): '{title[:30]}...' -> {url[:50]}...")
+                                append(_pack_result(title, url, snippet, position, "Bing (lxml)"))
+                    except Exception as parse_error:
+                        logger.error(f"Error during lxml extraction for Bing: {str(parse_error)}")
+            except NoSuchElementException as e:
+                # Bing's layout changed - retrying won't find the element either
+                logger.error(f"Bing page structure not recognised: {str(e)}")
+                break
+            except TimeoutException as e:
+                logger.warning(f"Bing search timed out: {str(e)}")
+            except WebDriverException as e:
+                # Chrome crashed or the session is gone; the next attempt starts a fresh browser
+                logger.error(f"Browser error during Bing search, restarting: {str(e)}")
+                await self._discard_driver()
             except Exception as e:
                 logger.error(f"Error using Bing search: {str(e)}")
-                retry_count += 1
-                time.sleep(2)
-                continue
             
             # If we have results, break out of retry loop
             if results:
                 break
-                
-            retry_count += 1
         
         return results
         
-    async def _search_alternative_engines(self, query):
-        """Legacy method kept for compatibility, redirects to API-based search"""
-        logger.warning("Using API-based search instead of alternative engines")
-        return await self._search_api_based(query)
-    
     async def _search_api_based(self, query):
         """Search using API-based providers that don't require browser automation"""
         results = []
         
         logger.info("Attempting API-based search")
         try:
-            # Use an API-based search provider that doesn't require browser automation
-            import requests
-            from urllib.parse import quote_plus
-            
-            # Try Searx, a privacy-focused metasearch engine
-            searx_instances = [
-                "https://searx.be/search",
-                "https://search.disroot.org/search",
-                "https://search.mdosch.de/search"
+            # Query every Searx instance at once and keep the first usable answer,
+            # so a dead instance no longer delays the ones behind it
+            session = self._get_http_session()
+            tasks = [
+                asyncio.create_task(self._search_searx(session, instance, query))
+                for instance in _SEARX_INSTANCES
             ]
-            
-            for instance in searx_instances:
-                try:
-                    headers = {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                        "Accept-Language": "en-US,en;q=0.9"
-                    }
-                    
-                    params = {
-                        "q": query,
-                        "format": "json"
-                    }
-                    
-                    response = requests.get(instance, params=params, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            
-                            if "results" in data and len(data["results"]) > 0:
-                                position = 0
-                                
-                                for item in data["results"]:
-                                    try:
-                                        title = item.get("title", "").strip()
-                                        url = item.get("url", "")
-                                        snippet = item.get("content", item.get("snippet", "No description available")).strip()
-                                        
-                                        # Validate that we have all required fields
-                                        if title and url and snippet:
-                                            position += 1
-                                            
-                                            results.append({
-                                                "title": title,
-                                                "url": url,
-                                                "snippet": snippet,
-                                                "position": position,
-                                                "source": "Searx API"
-                                            })
-                                            
-                                            if position >= settings.SEARCH_RESULTS_LIMIT:
-                                                break
-                                    except:
-                                        continue
-                                
-                                if results:
-                                    logger.info(f"Found {len(results)} results using Searx API")
-                                    break
-                        except:
-                            # If JSON parsing fails, the instance may not support JSON output
-                            continue
-                except:
-                    continue
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    results = await next_done
+                    if results:
+                        logger.info(f"Found {len(results)} results using Searx API")
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
             
             #show we are facing heavy traffic
 
             if not results:
                 logger.warning("All search methods failed, creating fallback results")
-                results.append({
-                    "title":"We are facing heavy traffic, please try again later",
-                    "url":"https://www.bing.com/search?q=We+are+facing+heavy+traffic,+please+try+again+later",
-                    "snippet":"We are facing heavy traffic, please try again later",
-                    "position":1,
-                    "source":"API-based search"
-                })
+                results.append(_pack_result(
+                    "We are facing heavy traffic, please try again later",
+                    "https://www.bing.com/search?q=We+are+facing+heavy+traffic,+please+try+again+later",
+                    "We are facing heavy traffic, please try again later",
+                    1,
+                    _PLACEHOLDER_SOURCE
+                ))
                 
                 logger.info("Added 1 fallback search results")
         except Exception as e:
@@ -584,23 +894,34 @@ class SeleniumBrowser:
         
         logger.info(f"API-based search found {len(results)} valid results")
         return results
-     
-    #not used anywhere
-    async def get_element_text(self, selector, by=By.CSS_SELECTOR, timeout=10):
-         """
-         Get text from an element
-         """
-         if not self.driver:
-             return ""
-             
-         try:
-             element = WebDriverWait(self.driver, timeout).until(
-                 EC.presence_of_element_located((by, selector))
-             )
-             return element.text
-         except Exception as e:
-             logger.error(f"Error getting element text: {str(e)}")
-             return ""
+    
+    async def _search_searx(self, session, instance, query):
+        """Query a single Searx instance, returning its results or an empty list"""
+        results = []
+        
+        try:
+            params = {
+                "q": query,
+                "format": "json"
+            }
+            
+            async with session.get(instance, params=params, timeout=10) as response:
+                if response.status != 200:
+                    return results
+                
+                try:
+                    data = orjson.loads(await response.read())
+                except ValueError:
+                    # If JSON parsing fails, the instance may not support JSON output
+                    return results
+            
+            items = _iter_searx_results(data.get("results", []))
+            for position, (title, url, snippet) in enumerate(islice(items, settings.SEARCH_RESULTS_LIMIT), 1):
+                results.append(_pack_result(title, url, snippet, position, "Searx API"))
+        except Exception as e:
+            logger.debug(f"Searx instance {instance} failed: {str(e)}")
+        
+        return results
      
     async def scroll_to_bottom(self, scroll_pause_time=1.0):
          """
@@ -610,49 +931,22 @@ class SeleniumBrowser:
              return
              
          try:
-             # Check if document.body exists and has a scrollHeight property
-             has_body = self.driver.execute_script("""
-                 return (document.body !== null && 
-                         document.body !== undefined && 
-                         typeof document.body.scrollHeight !== 'undefined');
-             """)
-             
-             if not has_body:
-                 # Try to use document.documentElement (HTML) instead
-                 has_html = self.driver.execute_script("""
-                     return (document.documentElement !== null && 
-                             document.documentElement !== undefined && 
-                             typeof document.documentElement.scrollHeight !== 'undefined');
-                 """)
-                 
-                 if not has_html:
-                     logger.warning("Cannot scroll as both document.body and document.documentElement are missing scrollHeight")
-                     return
-                 
-                 # Use document.documentElement for scrolling
-                 scroll_script = "document.documentElement.scrollHeight"
-                 scroll_to_script = "window.scrollTo(0, document.documentElement.scrollHeight);"
-             else:
-                 # Use document.body for scrolling (default)
-                 scroll_script = "document.body.scrollHeight"
-                 scroll_to_script = "window.scrollTo(0, document.body.scrollHeight);"
-             
-             # Get initial scroll height
-             last_height = self.driver.execute_script(f"return {scroll_script}")
+             # One round-trip per step: the script measures the page and scrolls to its bottom
+             last_height = await self._run(self.driver.execute_script, _SCROLL_STEP_JS)
+             if last_height is None:
+                 logger.warning("Cannot scroll as both document.body and document.documentElement are missing scrollHeight")
+                 return
              
              # Scroll down in multiple steps to trigger lazy loading
              scroll_attempts = 0
              max_attempts = 5  # Limit attempts to prevent infinite loops
              
              while scroll_attempts < max_attempts:
-                 # Scroll down to bottom
-                 self.driver.execute_script(scroll_to_script)
-                 
                  # Wait to load page
-                 time.sleep(scroll_pause_time)
+                 await asyncio.sleep(scroll_pause_time)
                  
-                 # Calculate new scroll height and compare with last scroll height
-                 new_height = self.driver.execute_script(f"return {scroll_script}")
+                 # Calculate new scroll height (and scroll again) and compare with last scroll height
+                 new_height = await self._run(self.driver.execute_script, _SCROLL_STEP_JS)
                  
                  if new_height == last_height:
                      # We've reached the bottom
@@ -664,5 +958,144 @@ class SeleniumBrowser:
          except Exception as e:
              logger.error(f"Error scrolling to bottom: {str(e)}")
  
+class SeleniumBrowserPool:
+    """
+    A fixed-size pool of SeleniumBrowser instances so concurrent searches each drive their own Chrome
+    """
+    
+    def __init__(self, size=None, headless=True):
+        """
+        Initialize the pool; browsers are created on demand up to size unless start() pre-warms them
+        """
+        self.size = size or settings.SELENIUM_POOL_SIZE
+        if settings.SELENIUM_DEBUGGER_ADDRESS and self.size > 1:
+            # Every slot would attach to the same Chrome, so concurrent searches would share one window
+            # and one slot's state reset would wipe another's cookies mid-search. The cap is per process,
+            # so attach mode is single-process only; nothing coordinates separate server workers
+            logger.warning(f"SELENIUM_DEBUGGER_ADDRESS is set, limiting the Selenium pool to 1 browser (was {self.size})")
+            self.size = 1
+        self.headless = headless
+        self.idle = asyncio.Queue()
+        # Every browser the pool has created, checked out or not
+        self.browsers = []
+        # Recent results keyed on (normalised query, limit), plus searches currently in flight
+        self.cache = TTLCache(maxsize=512, ttl=settings.CACHE_TTL)
+        self.inflight = {}
+        # HTTP session for the browserless Bing attempt, so it doesn't need a browser checked out
+        self.http_session = None
+    
+    async def start(self):
+        """
+        Pre-warm the pool by launching every remaining browser in parallel
+        """
+        browsers = [SeleniumBrowser(headless=self.headless) for _ in range(self.size - len(self.browsers))]
+        self.browsers.extend(browsers)
+        
+        # Each browser launches on its own executor thread, so these overlap
+        await asyncio.gather(*(browser.start() for browser in browsers))
+        for browser in browsers:
+            self.idle.put_nowait(browser)
+        logger.info(f"Selenium pool warmed with {len(browsers)} browsers")
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Check a browser out of the pool for the duration of the block
+        """
+        if self.idle.empty() and len(self.browsers) < self.size:
+            # Grow the pool; the browser starts itself on first navigation
+            browser = SeleniumBrowser(headless=self.headless)
+            self.browsers.append(browser)
+        else:
+            browser = await self.idle.get()
+        
+        try:
+            yield browser
+        finally:
+            await self.release(browser)
+    
+    async def release(self, browser):
+        """
+        Return a browser to the pool with the previous search's cookies and storage cleared
+        """
+        # Drop state Bing set during this search so it can't leak into the next checkout
+        await browser.reset_state()
+        self.idle.put_nowait(browser)
+    
+    async def search_google(self, query):
+        """
+        Run a search on whichever pooled browser is free, answering repeats from the cache
+        """
+        if not query or not settings.CACHE_ENABLED:
+            return await self._search(query)
+        
+        key = (query.strip().lower(), settings.SEARCH_RESULTS_LIMIT)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Serving cached results for: {query}")
+            return list(cached)
+        
+        # Identical concurrent queries share one underlying search
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search(query))
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        results = await asyncio.shield(task)
+        
+        if results and results[0]["source"] != _PLACEHOLDER_SOURCE:
+            self.cache[key] = results
+        return list(results)
+    
+    async def search_many(self, queries):
+        """
+        Search several queries across the pool at once, returning one result list per query in input order
+        """
+        limit = settings.SEARCH_RESULTS_LIMIT
+        # Longest-processing-time first: uncached queries claim browsers before instant cache hits
+        order = sorted(
+            range(len(queries)),
+            key=lambda i: (queries[i].strip().lower(), limit) in self.cache
+        )
+        tasks = {i: asyncio.create_task(self.search_google(queries[i])) for i in order}
+        await asyncio.gather(*tasks.values())
+        return [tasks[i].result() for i in range(len(queries))]
+    
+    def _get_http_session(self):
+        """
+        Get the pool's HTTP session, creating it on first use
+        """
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                headers=_SEARX_HEADERS,
+                connector=aiohttp.TCPConnector(limit=8)
+            )
+        return self.http_session
+    
+    async def _search(self, query):
+        """
+        Try Bing over plain HTTP, and only check out a browser if that comes back empty
+        """
+        if not query:
+            return []
+        
+        results = await _search_bing_http(self._get_http_session(), query)
+        if results:
+            return results[:settings.SEARCH_RESULTS_LIMIT]
+        
+        async with self.acquire() as browser:
+            return await browser.search_with_browser(query)
+    
+    async def stop(self):
+        """
+        Stop every browser the pool created, including ones still checked out
+        """
+        await asyncio.gather(*(browser.stop() for browser in self.browsers))
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+
 # Create a singleton instance that can be imported by other modules
-browser = SeleniumBrowser(headless=settings.SELENIUM_HEADLESS) 
\ No newline at end of file
+browser = SeleniumBrowser(headless=settings.SELENIUM_HEADLESS)
+
+# Shared pool for callers that run searches concurrently
+browser_pool = SeleniumBrowserPool(headless=settings.SELENIUM_HEADLESS)
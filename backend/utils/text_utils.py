@@ -1,23 +1,141 @@
+import os
 import re
+import multiprocessing
 import logging
 import html2text
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
+from nltk.tokenize import PunktSentenceTokenizer
+from nltk.corpus import stopwords, wordnet
 from nltk.stem import WordNetLemmatizer
+import numpy as np
 from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+def _ensure_nltk_data(resource: str, path: str) -> None:
+    """Download an NLTK resource only if it isn't installed already"""
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        nltk.download(resource, quiet=True)
+
 # Download necessary NLTK data
 try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
+    _ensure_nltk_data('punkt', 'tokenizers/punkt')
+    _ensure_nltk_data('stopwords', 'corpora/stopwords')
+    _ensure_nltk_data('wordnet', 'corpora/wordnet')
+    _ensure_nltk_data('omw-1.4', 'corpora/omw-1.4')
 except Exception as e:
     logger.warning(f"Failed to download NLTK data: {str(e)}")
 
+# Load the stopword list and lemmatizer once instead of on every call
+try:
+    _STOPWORDS = frozenset(stopwords.words('english'))
+except LookupError as e:
+    logger.warning(f"NLTK stopwords unavailable: {str(e)}")
+    _STOPWORDS = frozenset()
+_LEMMATIZER = WordNetLemmatizer()
+try:
+    wordnet.ensure_loaded()
+    # Web text repeats the same words constantly, so remember each word's lemma
+    _lemmatize = lru_cache(maxsize=65536)(_LEMMATIZER.lemmatize)
+except LookupError as e:
+    logger.warning(f"NLTK wordnet unavailable, keywords will not be lemmatized: {str(e)}")
+    # Match keywords on the raw tokens instead (str returns each token unchanged)
+    _lemmatize = str
+
+# Tokenizers built once; words only feed frequency counts, so a regex is enough
+_WORD_RE = re.compile(r"\w+")
+try:
+    _SENT_TOKENIZER = nltk.data.load('tokenizers/punkt/english.pickle')
+except LookupError as e:
+    logger.warning(f"NLTK punkt model unavailable, using an untrained sentence tokenizer: {str(e)}")
+    _SENT_TOKENIZER = PunktSentenceTokenizer()
+
+# Sentence boundary: terminal punctuation, whitespace, then a capital letter
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences with the regex splitter, or Punkt when NLTK_SENTENCE_SPLIT is on"""
+    if settings.NLTK_SENTENCE_SPLIT:
+        return _SENT_TOKENIZER.tokenize(text)
+    text = text.strip()
+    return _SENT_SPLIT_RE.split(text) if text else []
+
+def _count_sentences(text: str) -> int:
+    """Count sentences the same way _split_sentences splits them, without building the list"""
+    if settings.NLTK_SENTENCE_SPLIT:
+        return sum(1 for _ in _SENT_TOKENIZER.span_tokenize(text))
+    text = text.strip()
+    return sum(1 for _ in _SENT_SPLIT_RE.finditer(text)) + 1 if text else 0
+
+# html_to_text clean-up patterns
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_MARKDOWN_LINK_RE = re.compile(r'\[(.+?)\]\((.+?)\)')
+
+# clean_text patterns, compiled once; replacing with a space is safe since whitespace is collapsed last
+_URL_EMAIL_RE = re.compile(r'https?://\S+|\S+@\S+')
+_NON_WORD_RE = re.compile(r'[^\w\s]+|\d+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Cached implementations behind TextProcessor.clean_text/extract_keywords -
+# the same page text is often cleaned and scored more than once
+@lru_cache(maxsize=1024)
+def _clean_text(text: str) -> str:
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove URLs and email addresses
+    text = _URL_EMAIL_RE.sub(' ', text)
+    
+    # Remove special characters and numbers
+    text = _NON_WORD_RE.sub(' ', text)
+    
+    # Remove extra whitespace
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    
+    return text
+
+@lru_cache(maxsize=1024)
+def _extract_keywords(text: str, num_keywords: int) -> Tuple[str, ...]:
+    # Clean the text
+    clean_text = TextProcessor.clean_text(text)
+    
+    # Tokenize and remove stopwords in one streamed pass - no token or filtered-word lists
+    filtered_words = (
+        word for word in map(itemgetter(0), _WORD_RE.finditer(clean_text))
+        if len(word) > 2 and word not in _STOPWORDS
+    )
+    
+    # Count word frequency, lemmatizing each distinct word once and folding its count into the lemma
+    word_counts = Counter()
+    for word, count in Counter(filtered_words).items():
+        word_counts[_lemmatize(word)] += count
+    
+    # Return the most common words
+    return tuple(word for word, _ in word_counts.most_common(num_keywords))
+
+def _iter_paragraph_spans(text: str):
+    """Yield (start, end) offsets of the blank-line separated paragraphs in text"""
+    start = 0
+    for separator in _BLANK_LINES_RE.finditer(text):
+        yield start, separator.start()
+        start = separator.end()
+    yield start, len(text)
+
+def _keyword_mask(sentence: str, keyword_bits: Dict[str, int]) -> int:
+    """OR together the bits of every keyword lemma that occurs in the sentence"""
+    mask = 0
+    for word in _WORD_RE.findall(sentence.lower()):
+        mask |= keyword_bits.get(_lemmatize(word), 0)
+    return mask
+
 class TextProcessor:
     """Utility class for text processing"""
     
@@ -25,6 +143,7 @@ class TextProcessor:
     def html_to_text(html_content: str) -> str:
         """Convert HTML content to plain text"""
         try:
+            # A fresh converter per page: HTML2Text keeps its output buffer between handle() calls
             converter = html2text.HTML2Text()
             converter.ignore_links = False
             converter.ignore_images = True
@@ -35,8 +154,8 @@ class TextProcessor:
             text = converter.handle(html_content)
             
             # Clean up some markdown artifacts
-            text = re.sub(r'\n\s*\n', '\n\n', text)  # Remove extra newlines
-            text = re.sub(r'\[(.+?)\]\((.+?)\)', r'\1 (\2)', text)  # Convert links
+            text = _BLANK_LINES_RE.sub('\n\n', text)  # Remove extra newlines
+            text = _MARKDOWN_LINK_RE.sub(r'\1 (\2)', text)  # Convert links
             
             return text
         except Exception as e:
@@ -49,20 +168,19 @@ class TextProcessor:
         Attempt to extract the main content of a webpage by removing
         navigation, headers, footers, etc.
         """
-        # Simple heuristic - Find the longest paragraph
-        paragraphs = re.split(r'\n\s*\n', text)
-        if not paragraphs:
-            return text
+        # Simple heuristic - Find the longest paragraph, in one pass over the paragraph boundaries
+        # so no paragraph is copied unless it beats the current best
+        content_paragraph = ""
+        for start, end in _iter_paragraph_spans(text):
+            if end - start <= len(content_paragraph):
+                continue
             
-        # Filter out very short paragraphs
-        valid_paragraphs = [p for p in paragraphs if len(p.strip()) > 100]
-        if not valid_paragraphs:
-            return text
-            
-        # Find paragraph with highest content density (length / markup ratio)
-        content_paragraph = max(valid_paragraphs, key=len)
+            # Filter out very short paragraphs
+            paragraph = text[start:end]
+            if len(paragraph.strip()) > 100:
+                content_paragraph = paragraph
         
-        # If the chosen paragraph is too small, return the original text
+        # If the chosen paragraph is too small (or none qualified), return the original text
         if len(content_paragraph) < 200:
             return text
             
@@ -74,57 +192,34 @@ class TextProcessor:
         if not text:
             return ""
             
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove special characters and numbers
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return _clean_text(text)
     
     @staticmethod
     def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
-        """Extract key terms from text"""
+        """Extract key terms from text (always lowercase lemmas, so callers needn't lower() them)"""
         try:
-            # Clean the text
-            clean_text = TextProcessor.clean_text(text)
-            
-            # Tokenize
-            words = word_tokenize(clean_text)
-            
-            # Remove stopwords
-            stop_words = set(stopwords.words('english'))
-            filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
-            
-            # Lemmatize
-            lemmatizer = WordNetLemmatizer()
-            lemmatized_words = [lemmatizer.lemmatize(word) for word in filtered_words]
-            
-            # Count word frequency
-            word_counts = Counter(lemmatized_words)
-            
-            # Return the most common words
-            return [word for word, _ in word_counts.most_common(num_keywords)]
+            return list(_extract_keywords(text, num_keywords))
         except Exception as e:
             logger.error(f"Error extracting keywords: {str(e)}")
             return []
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached clean_text/extract_keywords results (for long-running processes)"""
+        _clean_text.cache_clear()
+        _extract_keywords.cache_clear()
+    
     @staticmethod
     def get_summary(text: str, num_sentences: int = 5) -> str:
         """Generate a simple extractive summary"""
         try:
+            # Short texts, or texts with too few sentence terminators to hold more than num_sentences
+            # sentences, are returned as-is without splitting, tokenizing or keyword extraction
+            if len(text) < 500 or text.count('.') + text.count('!') + text.count('?') < num_sentences:
+                return text
+            
             # Split into sentences
-            sentences = sent_tokenize(text)
+            sentences = _split_sentences(text)
             
             if len(sentences) <= num_sentences:
                 return text
@@ -137,29 +232,38 @@ class TextProcessor:
             keywords = TextProcessor.extract_keywords(clean_text, 20)
             
             # Score sentences based on keyword presence
-            sentence_scores = {}
-            for i, sentence in enumerate(clean_sentences):
-                sentence_scores[i] = 0
-                sentence_lower = sentence.lower()
-                
-                # Boost score for first few sentences
-                if i < 3:
-                    sentence_scores[i] += 3 - i
-                    
-                # Score based on keywords
-                for keyword in keywords:
-                    if keyword.lower() in sentence_lower:
-                        sentence_scores[i] += 1
-                        
-                # Length penalty for very short or very long sentences
-                length = len(sentence.split())
-                if length < 5:
-                    sentence_scores[i] -= 2
-                elif length > 40:
-                    sentence_scores[i] -= 1
-            
-            # Get top sentences
-            top_sentence_indices = sorted(sentence_scores, key=sentence_scores.get, reverse=True)[:num_sentences]
+            # (keywords are lemmas, so match them against each sentence's lemmatized tokens)
+            # Each keyword owns one bit, so a sentence's score is the popcount of its keyword mask
+            keyword_bits = {keyword: 1 << bit for bit, keyword in enumerate(keywords)}
+            sentence_count = len(clean_sentences)
+            if keyword_bits:
+                sentence_scores = np.fromiter(
+                    (_keyword_mask(sentence, keyword_bits).bit_count() for sentence in clean_sentences),
+                    dtype=np.int32,
+                    count=sentence_count
+                )
+            else:
+                # No keywords to match, so skip tokenizing and lemmatizing every sentence
+                sentence_scores = np.zeros(sentence_count, dtype=np.int32)
+            
+            # Boost score for first few sentences
+            boosted = min(3, sentence_count)
+            sentence_scores[:boosted] += np.arange(3, 3 - boosted, -1, dtype=np.int32)
+            
+            # Length penalty for very short or very long sentences
+            lengths = np.fromiter((len(sentence.split()) for sentence in clean_sentences), dtype=np.int32, count=sentence_count)
+            sentence_scores -= np.where(lengths < 5, 2, np.where(lengths > 40, 1, 0)).astype(np.int32)
+            
+            # Nothing to select (np.partition would reject the out-of-range kth)
+            if num_sentences <= 0:
+                return ""
+            
+            # Get top sentences: partition around the num_sentences-th best score instead of sorting
+            # everything, then fill any remaining slots with the earliest sentences tied at that score
+            cutoff = np.partition(sentence_scores, sentence_count - num_sentences)[sentence_count - num_sentences]
+            above = np.flatnonzero(sentence_scores > cutoff)
+            tied = np.flatnonzero(sentence_scores == cutoff)[:num_sentences - len(above)]
+            top_sentence_indices = np.concatenate((above, tied))
             top_sentence_indices.sort()  # Preserve original order
             
             # Combine the top sentences
@@ -170,17 +274,32 @@ class TextProcessor:
             logger.error(f"Error generating summary: {str(e)}")
             return text[:500] + "..."  # Fallback to truncation
     
+    @staticmethod
+    def batch_summarize(texts: List[str], num_sentences: int = 5, workers: Optional[int] = None) -> List[str]:
+        """Summarize independent documents in parallel worker processes (summaries keep input order)"""
+        if len(texts) < 2:
+            return [TextProcessor.get_summary(text, num_sentences) for text in texts]
+        
+        # Summarizing is CPU-bound Python, so use processes to get past the GIL; each worker
+        # imports this module and so loads the NLTK data and tokenizers once
+        workers = min(workers or os.cpu_count() or 1, len(texts))
+        chunksize = max(1, len(texts) // (4 * workers))
+        # Spawn rather than fork: the server process already runs Selenium/asyncio threads
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(TextProcessor.get_summary, texts, repeat(num_sentences), chunksize=chunksize))
+    
     @staticmethod
     def get_readability_score(text: str) -> float:
         """Get a simple readability score (higher is more complex)"""
         try:
-            sentences = sent_tokenize(text)
-            words = word_tokenize(text)
+            # Only the counts matter, so don't build the sentence and word lists
+            sentence_count = _count_sentences(text)
+            word_count = sum(1 for _ in _WORD_RE.finditer(text))
             
-            if not sentences or not words:
+            if not sentence_count or not word_count:
                 return 0
                 
-            avg_sentence_length = len(words) / len(sentences)
+            avg_sentence_length = word_count / sentence_count
             
             # Simple readability measure
             return min(10, avg_sentence_length / 2)  # Scale to 0-10